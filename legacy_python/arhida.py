@@ -1,9 +1,16 @@
+from collections import deque
+from contextlib import contextmanager
 from datetime import date, datetime, timedelta
-from time import sleep
+from pathlib import Path
+from time import monotonic
+import asyncio
+import functools
+import io
 import platform
 import os
 import logging
 import json
+import re
 import sys
 
 from dotenv import load_dotenv
@@ -11,12 +18,12 @@ from dotenv import load_dotenv
 # Load environment variables from .env file
 load_dotenv()
 
-from sickle import Sickle
-from sickle.oaiexceptions import NoRecordsMatch
+import aiohttp
+from lxml import etree
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import Json, RealDictCursor
 from psycopg2.errors import UniqueViolation
-from requests.exceptions import ConnectionError
+from psycopg2.pool import ThreadedConnectionPool
 
 from icecream import ic
 
@@ -29,338 +36,730 @@ DATABASE_NAME = os.getenv('POSTGRES_DB')
 SCHEMA_NAME = os.getenv('POSTGRES_SCHEMA')
 TABLE_NAME = os.getenv('POSTGRES_TABLE')
 
+# OAI-PMH XML namespaces
+OAI_NS = '{http://www.openarchives.org/OAI/2.0/}'
+OAI_DC_NS = '{http://www.openarchives.org/OAI/2.0/oai_dc/}'
+DC_NS = '{http://purl.org/dc/elements/1.1/}'
 
-def get_records(table_name, client, metadata_prefix="oai_dc", set_spec=None, from_date=None, until_date=None):
-    # Rate limiting configuration - arxiv.org requires max 1 request every 3 seconds
-    RATE_LIMIT_DELAY = int(os.getenv('ARXIV_RATE_LIMIT_DELAY', '3'))  # 3 seconds default
+# Collapses runs of whitespace in titles/descriptions in a single C pass
+_WS_RE = re.compile(r'\s+')
+
+# Namespace-qualified tags used on the per-record hot path, built once
+# instead of f-string formatting per record
+_RECORD_TAG = f'{OAI_NS}record'
+_ERROR_TAG = f'{OAI_NS}error'
+_TOKEN_TAG = f'{OAI_NS}resumptionToken'
+_HEADER_TAG = f'{OAI_NS}header'
+_DATESTAMP_TAG = f'{OAI_NS}datestamp'
+_IDENTIFIER_TAG = f'{OAI_NS}identifier'
+_SETSPEC_TAG = f'{OAI_NS}setSpec'
+_METADATA_DC_PATH = f'{OAI_NS}metadata/{OAI_DC_NS}dc'
+_DC_CREATOR_TAG = f'{DC_NS}creator'
+_DC_DATE_TAG = f'{DC_NS}date'
+_DC_DESCRIPTION_TAG = f'{DC_NS}description'
+_DC_IDENTIFIER_TAG = f'{DC_NS}identifier'
+_DC_SUBJECT_TAG = f'{DC_NS}subject'
+_DC_TITLE_TAG = f'{DC_NS}title'
+_DC_TYPE_TAG = f'{DC_NS}type'
+
+# Column order shared by the staging COPY and the merge into the target table
+COPY_COLUMNS = (
+    'header_datestamp', 'header_identifier', 'header_setSpecs',
+    'metadata_creator', 'metadata_date', 'metadata_description',
+    'metadata_identifier', 'metadata_subject', 'metadata_title', 'metadata_type'
+)
+
+# Columns stored as JSONB; everything else is copied as plain text
+JSONB_COLUMNS = frozenset([
+    'header_setSpecs', 'metadata_creator', 'metadata_date',
+    'metadata_identifier', 'metadata_subject', 'metadata_title'
+])
+
+# extract_record emits plain tuples in COPY_COLUMNS order, so the hot
+# path never builds or hashes a per-record dict; these indexes are the
+# only fields anything reads by position
+_DATESTAMP_IDX = COPY_COLUMNS.index('header_datestamp')
+_IDENTIFIER_IDX = COPY_COLUMNS.index('header_identifier')
+_JSONB_IDXS = frozenset(i for i, column in enumerate(COPY_COLUMNS) if column in JSONB_COLUMNS)
+
+
+class NoRecordsMatch(Exception):
+    """Raised when the OAI-PMH endpoint reports no records for a query"""
+
+
+class RateLimiter:
+    """Token bucket that only blocks actual HTTP issuance
+
+    acquire() waits just long enough that no more than max_calls requests
+    go out per period seconds, measured on the monotonic clock. Other
+    coroutines keep running during the wait, so batch processing and DB
+    commits overlap the mandated gap between requests for free.
+    """
+
+    def __init__(self, max_calls=1, period=3.0):
+        self.max_calls = max_calls
+        self.period = period
+        self._issued = deque(maxlen=max_calls)
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            if len(self._issued) == self.max_calls:
+                wait = self._issued[0] + self.period - monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            self._issued.append(monotonic())
+
+
+class OaiClient:
+    """Minimal async OAI-PMH ListRecords client for arxiv.org
+
+    A shared RateLimiter gates every request, so concurrent harvests
+    still respect arxiv.org's 1-request-per-3-seconds policy globally.
+    Tokens are only spent on actual HTTP calls; there is no idle sleep
+    before the first request or between batches.
+    """
+
+    def __init__(self, session, base_url, rate_limit_delay=3, max_retries=3, retry_after=5):
+        self.session = session
+        self.base_url = base_url
+        self.max_retries = max_retries
+        self.retry_after = retry_after
+        self.limiter = RateLimiter(max_calls=1, period=rate_limit_delay)
+
+    async def _fetch_stream(self, params):
+        """Stream one OAI-PMH page's body, honoring the rate limit and retrying on 503/429"""
+        last_error = None
+        for attempt in range(self.max_retries):
+            # Exponential backoff between attempts; an explicit Retry-After
+            # from the server takes precedence
+            backoff = self.retry_after * (2 ** attempt)
+            started = False
+            await self.limiter.acquire()
+            try:
+                async with self.session.get(self.base_url, params=params) as response:
+                    if response.status in (503, 429):
+                        retry_after = int(response.headers.get('Retry-After', backoff))
+                        logger.warning(f"Got {response.status} from {self.base_url}, retrying after {retry_after} seconds")
+                        await asyncio.sleep(retry_after)
+                        continue
+                    response.raise_for_status()
+                    async for chunk in response.content.iter_chunked(65536):
+                        started = True
+                        yield chunk
+                    return
+            except aiohttp.ClientError as e:
+                # A failure mid-body cannot be retried transparently; the
+                # consumer's parser has already seen part of the page
+                if started:
+                    raise
+                last_error = e
+                logger.error(f"HTTP error fetching {self.base_url} (attempt {attempt + 1}/{self.max_retries}): {e}")
+                await asyncio.sleep(backoff)
+        if last_error is not None:
+            raise last_error
+        raise aiohttp.ClientError(f"Exhausted {self.max_retries} retries against {self.base_url}")
+
+    async def list_records(self, metadata_prefix='oai_dc', set_spec=None, from_date=None, until_date=None):
+        """Yield <record> elements for a query, following resumption tokens"""
+        params = {'verb': 'ListRecords', 'metadataPrefix': metadata_prefix}
+        if set_spec:
+            params['set'] = set_spec
+        if from_date:
+            params['from'] = str(from_date)
+        if until_date:
+            params['until'] = str(until_date)
+
+        while True:
+            token = None
+
+            # Feed chunks into a pull parser as they arrive, so records are
+            # extracted (and batched downstream) before the page finishes
+            # downloading; records are cleared as soon as the caller is done
+            # with them, keeping peak memory independent of page size
+            parser = etree.XMLPullParser(events=('end',), tag=(_RECORD_TAG, _ERROR_TAG, _TOKEN_TAG))
+            async for chunk in self._fetch_stream(params):
+                parser.feed(chunk)
+                for _, elem in parser.read_events():
+                    if elem.tag == _RECORD_TAG:
+                        yield elem
+                        elem.clear()
+                        while elem.getprevious() is not None:
+                            del elem.getparent()[0]
+                    elif elem.tag == _ERROR_TAG:
+                        if elem.get('code') == 'noRecordsMatch':
+                            raise NoRecordsMatch(elem.text or 'noRecordsMatch')
+                        raise Exception(f"OAI-PMH error {elem.get('code')}: {elem.text}")
+                    else:
+                        token = (elem.text or '').strip()
+            parser.close()
+
+            if not token:
+                return
+            params = {'verb': 'ListRecords', 'resumptionToken': token}
+
+
+def _texts(parent, tag):
+    """Collect the text of every child matching a namespace-qualified tag"""
+    return [el.text or '' for el in parent.findall(tag)]
+
+
+def extract_record(record):
+    """Extract header and Dublin Core fields from one <record> element
+
+    Returns a tuple in COPY_COLUMNS order, or None for deleted records
+    and records without metadata.
+    """
+    header = record.find(_HEADER_TAG)
+    if header is None or header.get('status') == 'deleted':
+        return None
+
+    metadata = record.find(_METADATA_DC_PATH)
+    if metadata is None:
+        return None
+
+    descriptions = _texts(metadata, _DC_DESCRIPTION_TAG)
+    titles = _texts(metadata, _DC_TITLE_TAG)
+    types = _texts(metadata, _DC_TYPE_TAG)
+
+    return (
+        header.findtext(_DATESTAMP_TAG),
+        header.findtext(_IDENTIFIER_TAG),
+        _texts(header, _SETSPEC_TAG),
+        _texts(metadata, _DC_CREATOR_TAG),
+        _texts(metadata, _DC_DATE_TAG),
+        _WS_RE.sub(' ', descriptions[0]).strip() if descriptions else None,
+        _texts(metadata, _DC_IDENTIFIER_TAG),
+        _texts(metadata, _DC_SUBJECT_TAG),
+        _WS_RE.sub(' ', titles[0]).strip() if titles else None,
+        types[0] if types else None,
+    )
+
+
+async def get_records(table_name, client, metadata_prefix="oai_dc", set_spec=None, from_date=None, until_date=None, known_new=False):
     BATCH_SIZE = int(os.getenv('ARXIV_BATCH_SIZE', '2000'))  # Max 2000 records per batch
-    MAX_RETRIES = int(os.getenv('ARXIV_MAX_RETRIES', '3'))
-    
-    conn = get_postgres_connection()
-    cursor = conn.cursor(cursor_factory=RealDictCursor)
 
     logger.info(f"Starting harvest for set_spec: {set_spec}, from: {from_date}, until: {until_date}")
-    
-    # Harvest records using sickle with rate limiting
+
     total_processed = 0
     batch_count = 0
-    
-    try:
-        # Add delay before first request to comply with rate limits
-        logger.info(f"Waiting {RATE_LIMIT_DELAY} seconds before first request to comply with arxiv.org rate limits")
-        sleep(RATE_LIMIT_DELAY)
-        
-        records = client.ListRecords(
-            **{
-                'metadataPrefix': metadata_prefix, 
-                'set': set_spec, 
-                'from': from_date, 
-                'until': until_date,
-                'ignore_deleted': True
-            }
-        )
-
-    except NoRecordsMatch as e:
-        logger.warning(f'No records found for {set_spec} from {from_date} to {until_date}: {e}')
-        return 0
-    except Exception as e:
-        logger.error(f'Error fetching records for {set_spec}: {e}')
-        return -1
 
-    if records:
-        # Process records in batches to comply with arxiv.org limits
-        try:
-            batch = []
-            for record in records:
-                header = record.header
-                metadata = record.metadata
-                dict_header = dict(header)
-                dict_metadata = dict(metadata)
-
-                extracted = {
-                        'header_datestamp': dict_header['datestamp'],
-                        'header_identifier': dict_header['identifier'],
-                        'header_setSpecs': dict_header['setSpecs'],
-                        'metadata_creator': dict_metadata['creator'],
-                        'metadata_date': dict_metadata['date'],
-                        'metadata_description': " ".join(dict_metadata['description'][0].split()),
-                        'metadata_identifier': dict_metadata['identifier'],
-                        'metadata_subject': dict_metadata['subject'],
-                        'metadata_title': " ".join(dict_metadata['title'][0].split()),
-                        'metadata_type': dict_metadata['type'],
-                    }
-                
-                batch.append(extracted)
-                
-                # Process batch when it reaches the size limit
-                if len(batch) >= BATCH_SIZE:
-                    batch_count += 1
-                    logger.info(f"Processing batch {batch_count} with {len(batch)} records")
-                    processed_in_batch = process_batch(cursor, conn, table_name, batch, set_spec)
-                    total_processed += processed_in_batch
-                    batch = []
-                    
-                    # Rate limiting: wait between batches
-                    logger.info(f"Rate limiting: waiting {RATE_LIMIT_DELAY} seconds before next batch")
-                    sleep(RATE_LIMIT_DELAY)
-            
-            # Process remaining records in the last batch
-            if batch:
+    with pg_conn() as conn:
+        cursor = conn.cursor(cursor_factory=RealDictCursor)
+
+        if known_new:
+            # Initial reseed after reset_arxiv: skip the WAL flush wait on
+            # each commit. A crash can lose the last few batches, but those
+            # dates show up in get_missing_dates and get re-harvested, so
+            # trading that ack for throughput is safe here.
+            cursor.execute('SET synchronous_commit TO off')
+
+        # Stage batches in a temp table private to this session; see
+        # staging_ddl for why staging is not shared between harvests
+        cursor.execute(staging_ddl(table_name))
+        conn.commit()
+
+        # Bounded queue of batches: the producer keeps fetching and parsing
+        # the next page while the consumer flushes the previous batch, so
+        # the DB write for batch N overlaps the HTTP wait for batch N+1
+        batch_queue = asyncio.Queue(maxsize=2)
+
+        async def producer():
+            # Key batches by identifier so duplicates across resumption
+            # pages collapse to the newest datestamp before reaching the
+            # database; each duplicate would otherwise cost a full row
+            # rewrite plus index churn in the merge
+            batch = {}
+            try:
+                async for record in client.list_records(metadata_prefix, set_spec, from_date, until_date):
+                    # Keep exception scope to the single record: one
+                    # malformed entry is logged and skipped instead of
+                    # aborting the rest of the harvest
+                    try:
+                        extracted = extract_record(record)
+                    except Exception as e:
+                        logger.warning(f"Skipping malformed record in {set_spec}: {e}")
+                        continue
+                    if extracted is None:
+                        continue
+
+                    identifier = extracted[_IDENTIFIER_IDX]
+                    previous = batch.get(identifier)
+                    if previous is None or (extracted[_DATESTAMP_IDX] or '') > (previous[_DATESTAMP_IDX] or ''):
+                        batch[identifier] = extracted
+
+                    if len(batch) >= BATCH_SIZE:
+                        await batch_queue.put(list(batch.values()))
+                        batch = {}
+
+                # Queue remaining records as the last batch
+                if batch:
+                    await batch_queue.put(list(batch.values()))
+            finally:
+                await batch_queue.put(None)
+
+        async def consumer():
+            nonlocal total_processed, batch_count
+            while True:
+                batch = await batch_queue.get()
+                if batch is None:
+                    return
                 batch_count += 1
-                logger.info(f"Processing final batch {batch_count} with {len(batch)} records")
-                processed_in_batch = process_batch(cursor, conn, table_name, batch, set_spec)
-                total_processed += processed_in_batch
-                
-        except ConnectionError as f:
-            logger.error(f'Connection error during iteration: {f}')
-            logger.error(f'Response text: {f.response.text if hasattr(f, "response") else "No response text"}')
-            sleep(RATE_LIMIT_DELAY)
-        except Exception as h:
-            logger.error(f'Unexpected error during iteration: {h}')
-    
-    # Close database connection
-    cursor.close()
-    conn.close()
-    
+                logger.info(f"Processing batch {batch_count} with {len(batch)} records")
+                # psycopg2 is sync, so flush in a thread and let other
+                # harvests (and our producer) proceed meanwhile
+                total_processed += await asyncio.to_thread(process_batch, cursor, conn, table_name, batch, set_spec, known_new)
+
+        producer_task = asyncio.create_task(producer())
+        consumer_task = asyncio.create_task(consumer())
+        try:
+            await asyncio.gather(producer_task, consumer_task)
+        except NoRecordsMatch as e:
+            logger.warning(f'No records found for {set_spec} from {from_date} to {until_date}: {e}')
+            return 0
+        except aiohttp.ClientError as e:
+            logger.error(f'Connection error during iteration for {set_spec}: {e}')
+            return -1
+        except Exception as e:
+            logger.error(f'Unexpected error during iteration for {set_spec}: {e}')
+            return -1
+        finally:
+            # One side failing must not strand the other: a dead consumer
+            # leaves the producer blocked on a full queue forever, and a
+            # dead producer must not let the connection go back to the
+            # pool while the consumer still has a flush in flight on it.
+            # Cancel both (a no-op when already done), unblock a producer
+            # stuck on put by draining the queue, then wait for both to
+            # actually finish before touching the connection. A consumer
+            # mid-flush in to_thread only observes the cancellation after
+            # its batch completes, which is exactly the ordering needed.
+            for task in (producer_task, consumer_task):
+                task.cancel()
+            while not batch_queue.empty():
+                batch_queue.get_nowait()
+            for task in (producer_task, consumer_task):
+                try:
+                    await task
+                except (asyncio.CancelledError, Exception):
+                    pass
+            if known_new:
+                # The session goes back to the pool; restore the default
+                # before another caller inherits it
+                conn.rollback()
+                cursor.execute('RESET synchronous_commit')
+                conn.commit()
+            cursor.close()
+
     logger.info(f"Completed harvest for {set_spec}: {total_processed} records processed in {batch_count} batches")
     return total_processed
 
 
-def process_batch(cursor, conn, table_name, batch, set_spec):
-    """Process a batch of records and insert them into PostgreSQL"""
-    processed_count = 0
-    
-    for extracted in batch:
+@functools.lru_cache(maxsize=4096)
+def _dump_tuple(values):
+    """Cached json.dumps for list values; setSpecs and subjects repeat heavily"""
+    return json.dumps(list(values))
+
+
+def safe_json_serialize(data):
+    """Serialize a value for a JSONB column, or None for SQL NULL"""
+    if data is None:
+        return None
+    if isinstance(data, list):
+        return _dump_tuple(tuple(data))
+    return json.dumps(data)
+
+
+def copy_line(extracted):
+    """Format one record as a tab-separated line for COPY ... FROM STDIN"""
+    values = []
+    for index, value in enumerate(extracted):
+        if index in _JSONB_IDXS:
+            value = safe_json_serialize(value)
+        if value is None:
+            values.append('\\N')
+        else:
+            values.append(
+                str(value)
+                .replace('\\', '\\\\')
+                .replace('\t', '\\t')
+                .replace('\n', '\\n')
+                .replace('\r', '\\r')
+            )
+    return '\t'.join(values) + '\n'
+
+
+@functools.lru_cache(maxsize=None)
+def staging_ddl(table_name):
+    """Build the session-local staging table DDL once per table
+
+    Each harvest stages batches in a temp table private to its pooled
+    session, so concurrent flushes never contend on a shared relation
+    (two COPY -> merge -> TRUNCATE transactions against one staging
+    table deadlock on each other's locks). Temp tables skip WAL like
+    the unlogged table did, and ON COMMIT DELETE ROWS clears the rows
+    at each batch commit without an explicit TRUNCATE. IF NOT EXISTS
+    because pooled sessions are reused across harvests.
+    """
+    columns = ',\n            '.join((
+        'header_datestamp TIMESTAMP',
+        'header_identifier VARCHAR(255)',
+        'header_setSpecs JSONB',
+        'metadata_creator JSONB',
+        'metadata_date JSONB',
+        'metadata_description TEXT',
+        'metadata_identifier JSONB',
+        'metadata_subject JSONB',
+        'metadata_title JSONB',
+        'metadata_type VARCHAR(100)',
+    ))
+    return f"""
+        CREATE TEMP TABLE IF NOT EXISTS {table_name}_staging (
+            {columns}
+        ) ON COMMIT DELETE ROWS
+    """
+
+
+@functools.lru_cache(maxsize=None)
+def copy_sql(table_name):
+    """Build the staging COPY statement once per table"""
+    return (
+        f"COPY {table_name}_staging ({', '.join(COPY_COLUMNS)}) "
+        f"FROM STDIN WITH (FORMAT text)"
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def copy_direct_sql(table_name):
+    """Build the direct-to-target COPY statement for known-new batches"""
+    return (
+        f"COPY {SCHEMA_NAME}.{table_name} ({', '.join(COPY_COLUMNS)}) "
+        f"FROM STDIN WITH (FORMAT text)"
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def merge_sql(table_name):
+    """Build the staging-to-target merge statement once per table
+
+    Merges the session's temp staging table into the target with a
+    single UPSERT; ON COMMIT DELETE ROWS empties staging when the batch
+    commits.
+    """
+    column_list = ', '.join(COPY_COLUMNS)
+    return f"""
+        INSERT INTO {SCHEMA_NAME}.{table_name} ({column_list})
+        SELECT {column_list} FROM {table_name}_staging
+        ON CONFLICT (header_identifier)
+        DO UPDATE SET
+            header_datestamp = EXCLUDED.header_datestamp,
+            header_setSpecs = EXCLUDED.header_setSpecs,
+            metadata_creator = EXCLUDED.metadata_creator,
+            metadata_date = EXCLUDED.metadata_date,
+            metadata_description = EXCLUDED.metadata_description,
+            metadata_identifier = EXCLUDED.metadata_identifier,
+            metadata_subject = EXCLUDED.metadata_subject,
+            metadata_title = EXCLUDED.metadata_title,
+            metadata_type = EXCLUDED.metadata_type,
+            updated_at = CURRENT_TIMESTAMP
+    """
+
+
+def process_batch(cursor, conn, table_name, batch, set_spec, known_new=False):
+    """Bulk-load a batch into the staging table with COPY and merge into the target
+
+    With known_new=True (initial harvest into a freshly created table)
+    the staging merge is skipped and the batch is COPYed straight into
+    the target; a duplicate identifier falls back to the upsert path.
+    """
+    # Serialize the whole batch in one pass; a single join builds the
+    # COPY payload without per-record StringIO write calls
+    buffer = io.StringIO(''.join(map(copy_line, batch)))
+
+    if known_new:
         try:
-            # Safely convert data to JSON for PostgreSQL storage
-            def safe_json_serialize(data):
-                """Safely serialize data to JSON, handling various input types"""
-                if data is None:
-                    return None
-                elif isinstance(data, (list, dict)):
-                    return json.dumps(data)
-                elif isinstance(data, str):
-                    # If it's already a string, try to parse it as JSON first
-                    try:
-                        parsed = json.loads(data)
-                        return json.dumps(parsed)
-                    except (json.JSONDecodeError, TypeError):
-                        # If it's not valid JSON, wrap it as a string
-                        return json.dumps(data)
-                else:
-                    return json.dumps(data)
-            
-            header_set_specs = safe_json_serialize(extracted['header_setSpecs'])
-            metadata_creator = safe_json_serialize(extracted['metadata_creator'])
-            metadata_date = safe_json_serialize(extracted['metadata_date'])
-            metadata_identifier = safe_json_serialize(extracted['metadata_identifier'])
-            metadata_subject = safe_json_serialize(extracted['metadata_subject'])
-            metadata_title = safe_json_serialize(extracted['metadata_title'])
-            
-            # Use UPSERT (INSERT ... ON CONFLICT ... DO UPDATE)
-            upsert_query = f"""
-                INSERT INTO {SCHEMA_NAME}.{table_name} (
-                    header_datestamp, header_identifier, header_setSpecs,
-                    metadata_creator, metadata_date, metadata_description,
-                    metadata_identifier, metadata_subject, metadata_title, metadata_type
-                ) VALUES (
-                    %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
+            cursor.copy_expert(copy_direct_sql(table_name), buffer)
+            conn.commit()
+            logger.info(f"Batch processing complete: {len(batch)} records inserted for {set_spec}")
+            return len(batch)
+        except UniqueViolation:
+            conn.rollback()
+            logger.warning(f"Batch for {set_spec} contained existing identifiers, falling back to upsert")
+            buffer.seek(0)
+
+    try:
+        cursor.copy_expert(copy_sql(table_name), buffer)
+        cursor.execute(merge_sql(table_name))
+        conn.commit()
+    except Exception as e:
+        logger.error(f"Error processing batch of {len(batch)} records for {set_spec}: {e}")
+        conn.rollback()
+        return 0
+
+    logger.info(f"Batch processing complete: {len(batch)} records inserted for {set_spec}")
+    return len(batch)
+
+
+def reset_arxiv(table_name):
+    """Create PostgreSQL schema, table and indexes for arXiv data"""
+    with pg_conn() as conn:
+        cursor = conn.cursor()
+        try:
+            # Create schema
+            cursor.execute(f"CREATE SCHEMA IF NOT EXISTS {SCHEMA_NAME}")
+            logger.info(f"Created {SCHEMA_NAME} schema")
+
+            # Create table in schema
+            create_table_query = f"""
+                CREATE TABLE IF NOT EXISTS {SCHEMA_NAME}.{table_name} (
+                    id SERIAL PRIMARY KEY,
+                    header_datestamp TIMESTAMP,
+                    header_identifier VARCHAR(255) UNIQUE NOT NULL,
+                    header_setSpecs JSONB,
+                    metadata_creator JSONB,
+                    metadata_date JSONB,
+                    metadata_description TEXT,
+                    metadata_identifier JSONB,
+                    metadata_subject JSONB,
+                    metadata_title JSONB,
+                    metadata_type VARCHAR(100),
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
-                ON CONFLICT (header_identifier) 
-                DO UPDATE SET
-                    header_datestamp = EXCLUDED.header_datestamp,
-                    header_setSpecs = EXCLUDED.header_setSpecs,
-                    metadata_creator = EXCLUDED.metadata_creator,
-                    metadata_date = EXCLUDED.metadata_date,
-                    metadata_description = EXCLUDED.metadata_description,
-                    metadata_identifier = EXCLUDED.metadata_identifier,
-                    metadata_subject = EXCLUDED.metadata_subject,
-                    metadata_title = EXCLUDED.metadata_title,
-                    metadata_type = EXCLUDED.metadata_type,
-                    updated_at = CURRENT_TIMESTAMP
             """
-            
-            # Prepare data for insertion
-            insert_data = (
-                extracted['header_datestamp'],
-                extracted['header_identifier'],
-                header_set_specs,
-                metadata_creator,
-                metadata_date,
-                extracted['metadata_description'],
-                metadata_identifier,
-                metadata_subject,
-                metadata_title,
-                extracted['metadata_type']
-            )
-            
-            cursor.execute(upsert_query, insert_data)
-            
-            processed_count += 1
-            
-            if processed_count % 100 == 0:  # Log progress every 100 records
-                logger.info(f"Processed {processed_count} records in current batch for {set_spec}")
-                
+            cursor.execute(create_table_query)
+            logger.info(f"Created table {SCHEMA_NAME}.{table_name}")
+
+            # Drop the shared staging table from older deployments; each
+            # harvest now stages in a session-local temp table instead
+            cursor.execute(f"DROP TABLE IF EXISTS {SCHEMA_NAME}.{table_name}_staging")
+
+            # Drop the primary_set column from older deployments; it only
+            # captured the first setSpec, which is not guaranteed to be
+            # the harvest set, so the missing-date query probes the full
+            # header_setSpecs array instead
+            cursor.execute(f"ALTER TABLE {SCHEMA_NAME}.{table_name} DROP COLUMN IF EXISTS primary_set")
+
+            # Create indexes
+            indexes = [
+                f"CREATE UNIQUE INDEX IF NOT EXISTS {table_name}_header_identifier_idx ON {SCHEMA_NAME}.{table_name} (header_identifier)",
+                f"CREATE INDEX IF NOT EXISTS {table_name}_header_datestamp_idx ON {SCHEMA_NAME}.{table_name} (header_datestamp)",
+                f"CREATE INDEX IF NOT EXISTS {table_name}_header_setspecs_idx ON {SCHEMA_NAME}.{table_name} USING GIN (header_setSpecs)",
+                f"CREATE INDEX IF NOT EXISTS {table_name}_header_datestamp_setspecs_idx ON {SCHEMA_NAME}.{table_name} (header_datestamp, header_setSpecs)",
+                f"CREATE INDEX IF NOT EXISTS {table_name}_metadata_subject_idx ON {SCHEMA_NAME}.{table_name} USING GIN (metadata_subject)",
+                f"CREATE INDEX IF NOT EXISTS {table_name}_created_at_idx ON {SCHEMA_NAME}.{table_name} (created_at)",
+                f"CREATE INDEX IF NOT EXISTS {table_name}_updated_at_idx ON {SCHEMA_NAME}.{table_name} (updated_at)"
+            ]
+
+            # Send all index DDL in one round-trip instead of one per index
+            cursor.execute(';\n'.join(indexes))
+
+            conn.commit()
+            logger.info(f"Created indexes for table {SCHEMA_NAME}.{table_name}")
+
         except Exception as e:
-            logger.error(f"Error processing record {extracted.get('header_identifier', 'unknown')}: {e}")
-            logger.debug(f"Record data: {extracted}")
-            continue
-    
-    # Commit the batch
-    conn.commit()
-    logger.info(f"Batch processing complete: {processed_count} records inserted for {set_spec}")
-    return processed_count
+            logger.error(f"Error creating schema/table/indexes for {SCHEMA_NAME}.{table_name}: {e}")
+            conn.rollback()
+        finally:
+            cursor.close()
 
 
-def reset_arxiv(table_name):
-    """Create PostgreSQL schema, table and indexes for arXiv data"""
-    conn = get_postgres_connection()
-    cursor = conn.cursor()
-    
-    try:
-        # Create schema
-        cursor.execute(f"CREATE SCHEMA IF NOT EXISTS {SCHEMA_NAME}")
-        logger.info(f"Created {SCHEMA_NAME} schema")
-
-        # Create table in schema
-        create_table_query = f"""
-            CREATE TABLE IF NOT EXISTS {SCHEMA_NAME}.{table_name} (
-                id SERIAL PRIMARY KEY,
-                header_datestamp TIMESTAMP,
-                header_identifier VARCHAR(255) UNIQUE NOT NULL,
-                header_setSpecs JSONB,
-                metadata_creator JSONB,
-                metadata_date JSONB,
-                metadata_description TEXT,
-                metadata_identifier JSONB,
-                metadata_subject JSONB,
-                metadata_title JSONB,
-                metadata_type VARCHAR(100),
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+def pause_indexes(table_name):
+    """Drop the GIN indexes ahead of a bulk backfill
+
+    GIN maintenance on every upserted row dominates large loads; the
+    unique btree on header_identifier stays in place since ON CONFLICT
+    needs it.
+    """
+    with pg_conn() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(f"DROP INDEX IF EXISTS {SCHEMA_NAME}.{table_name}_header_setspecs_idx")
+            cursor.execute(f"DROP INDEX IF EXISTS {SCHEMA_NAME}.{table_name}_metadata_subject_idx")
+            conn.commit()
+            logger.info(f"Dropped GIN indexes on {SCHEMA_NAME}.{table_name} for bulk load")
+        except Exception as e:
+            logger.error(f"Error dropping GIN indexes on {SCHEMA_NAME}.{table_name}: {e}")
+            conn.rollback()
+        finally:
+            cursor.close()
+
+
+def resume_indexes(table_name):
+    """Rebuild the GIN indexes after a bulk backfill without blocking reads"""
+    with pg_conn() as conn:
+        cursor = conn.cursor()
+        try:
+            # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+            conn.autocommit = True
+
+            # A failed concurrent build leaves an INVALID index behind,
+            # which IF NOT EXISTS would then skip on every later run;
+            # drop any such leftover before recreating
+            cursor.execute("""
+                SELECT c.relname
+                FROM pg_index i
+                JOIN pg_class c ON c.oid = i.indexrelid
+                JOIN pg_class t ON t.oid = i.indrelid
+                JOIN pg_namespace n ON n.oid = t.relnamespace
+                WHERE n.nspname = %s AND t.relname = %s AND NOT i.indisvalid
+            """, (SCHEMA_NAME, table_name))
+            for (index_name,) in cursor.fetchall():
+                logger.warning(f"Dropping invalid index {SCHEMA_NAME}.{index_name} left by a failed concurrent build")
+                cursor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {SCHEMA_NAME}.{index_name}")
+
+            cursor.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {table_name}_header_setspecs_idx ON {SCHEMA_NAME}.{table_name} USING GIN (header_setSpecs)")
+            cursor.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {table_name}_metadata_subject_idx ON {SCHEMA_NAME}.{table_name} USING GIN (metadata_subject)")
+            logger.info(f"Rebuilt GIN indexes on {SCHEMA_NAME}.{table_name}")
+        except Exception as e:
+            logger.error(f"Error rebuilding GIN indexes on {SCHEMA_NAME}.{table_name}: {e}")
+        finally:
+            conn.autocommit = False
+            cursor.close()
+
+
+def ensure_arxiv_table(table_name):
+    """Run the schema DDL only if a required schema object is missing
+
+    reset_arxiv issues 9+ DDL statements that each round-trip and briefly
+    take an AccessExclusive lock even when IF NOT EXISTS makes them
+    no-ops; probing first skips all of that on an up-to-date schema. The
+    probe must cover every object the runtime depends on that only
+    reset_arxiv creates; with staging session-local and the per-set
+    probe reading header_setSpecs directly, that is just the target
+    table. Returns True when the table had to be created (i.e. every
+    harvested record is known new).
+    """
+    with pg_conn() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(
+                "SELECT 1 FROM information_schema.tables WHERE table_schema = %s AND table_name = %s",
+                (SCHEMA_NAME, table_name)
             )
-        """
-        cursor.execute(create_table_query)
-        logger.info(f"Created table {SCHEMA_NAME}.{table_name}")
-
-        # Create indexes
-        indexes = [
-            f"CREATE UNIQUE INDEX IF NOT EXISTS {table_name}_header_identifier_idx ON {SCHEMA_NAME}.{table_name} (header_identifier)",
-            f"CREATE INDEX IF NOT EXISTS {table_name}_header_datestamp_idx ON {SCHEMA_NAME}.{table_name} (header_datestamp)",
-            f"CREATE INDEX IF NOT EXISTS {table_name}_header_setspecs_idx ON {SCHEMA_NAME}.{table_name} USING GIN (header_setSpecs)",
-            f"CREATE INDEX IF NOT EXISTS {table_name}_header_datestamp_setspecs_idx ON {SCHEMA_NAME}.{table_name} (header_datestamp, header_setSpecs)",
-            f"CREATE INDEX IF NOT EXISTS {table_name}_metadata_subject_idx ON {SCHEMA_NAME}.{table_name} USING GIN (metadata_subject)",
-            f"CREATE INDEX IF NOT EXISTS {table_name}_created_at_idx ON {SCHEMA_NAME}.{table_name} (created_at)",
-            f"CREATE INDEX IF NOT EXISTS {table_name}_updated_at_idx ON {SCHEMA_NAME}.{table_name} (updated_at)"
-        ]
-        
-        for index_query in indexes:
-            cursor.execute(index_query)
-            
-        conn.commit()
-        logger.info(f"Created indexes for table {SCHEMA_NAME}.{table_name}")
+            exists = cursor.fetchone() is not None
+        finally:
+            cursor.close()
 
-    except Exception as e:
-        logger.error(f"Error creating schema/table/indexes for {SCHEMA_NAME}.{table_name}: {e}")
-        conn.rollback()
-    finally:
-        cursor.close()
-        conn.close()
-
-
-def get_postgres_connection():
-    """Get PostgreSQL database connection"""
-    if platform.system() == 'Darwin':
-        # For local development on macOS
-        connection_params = {
-            'host': os.getenv('POSTGRES_HOST'),
-            'database': DATABASE_NAME,
-            'user': os.getenv('POSTGRES_USER'),
-            'password': os.getenv('POSTGRES_PASSWORD'),
-            'port': int(os.getenv('POSTGRES_PORT'))
-        }
-    elif platform.system() == 'Linux':
+    if exists:
+        logger.info(f"Table {SCHEMA_NAME}.{table_name} already exists, skipping DDL")
+        return False
+
+    reset_arxiv(table_name)
+    return True
+
+
+@functools.lru_cache(maxsize=1)
+def get_connection_params():
+    """Resolve PostgreSQL connection parameters
+
+    One code path for every platform; only the credential source differs
+    (Docker secrets on Linux, environment variables elsewhere). Cached
+    for the life of the process: credentials do not change during a run,
+    so the secret files are read at most once.
+    """
+    if platform.system() == 'Linux':
         # For Docker/Linux environment - use existing db-postgres service
-        auth_usr_file = os.getenv('DOCKER_POSTGRES_USER_FILE')
-        auth_pwd_file = os.getenv('DOCKER_POSTGRES_PASSWORD_FILE')
-
-        with open(auth_usr_file) as f:
-            usr = f.read().strip()
-
-        with open(auth_pwd_file) as g:
-            pwd = g.read().strip()
-
-        connection_params = {
-            'host': os.getenv('DOCKER_POSTGRES_HOST'),
-            'database': DATABASE_NAME,
-            'user': usr,
-            'password': pwd,
-            'port': int(os.getenv('POSTGRES_PORT'))
-        }
+        host = os.getenv('DOCKER_POSTGRES_HOST')
+        usr = Path(os.getenv('DOCKER_POSTGRES_USER_FILE')).read_text().strip()
+        pwd = Path(os.getenv('DOCKER_POSTGRES_PASSWORD_FILE')).read_text().strip()
     else:
-        raise Exception(f"Unsupported platform: {platform.system()}")
+        # For local development (macOS etc.)
+        host = os.getenv('POSTGRES_HOST', 'localhost')
+        usr = os.getenv('POSTGRES_USER')
+        pwd = os.getenv('POSTGRES_PASSWORD')
 
-    try:
-        conn = psycopg2.connect(**connection_params)
-        return conn
-    except Exception as e:
-        logger.error(f"Failed to connect to PostgreSQL: {e}")
-        raise
+    return {
+        'host': host,
+        'database': DATABASE_NAME,
+        'user': usr,
+        'password': pwd,
+        'port': int(os.getenv('POSTGRES_PORT', '5432'))
+    }
 
 
-def get_date_list(date_start, date_end):
-    ds = date.fromisoformat(date_start)
-    de = date.fromisoformat(date_end)
+_POOL = None
 
-    return([(ds + timedelta(days=x)).isoformat() for x in range((de - ds).days)])
 
+def _get_pool(min_connections=None):
+    """Create the shared connection pool on first use
 
-def get_missing_dates(start_date, end_date, set_spec=None):
-    """Get missing dates from the database for a given date range and set_spec"""
-    conn = get_postgres_connection()
-    cursor = conn.cursor()
-    
+    Each concurrent harvest holds a connection for its whole run and
+    getconn raises PoolError immediately instead of blocking when the
+    pool is empty, so the pool must cover the worst-case concurrency:
+    callers that know it (one connection per set_spec plus headroom for
+    the maintenance helpers) pass min_connections before the first
+    borrow, and POSTGRES_POOL_MAX only ever raises the ceiling.
+    """
+    global _POOL
+    if _POOL is None:
+        max_connections = int(os.getenv('POSTGRES_POOL_MAX', '8'))
+        if min_connections is not None:
+            max_connections = max(max_connections, min_connections)
+        try:
+            _POOL = ThreadedConnectionPool(1, max_connections, **get_connection_params())
+        except Exception as e:
+            logger.error(f"Failed to connect to PostgreSQL: {e}")
+            raise
+    return _POOL
+
+
+@contextmanager
+def pg_conn():
+    """Borrow a connection from the shared pool and return it when done"""
+    connection_pool = _get_pool()
+    conn = connection_pool.getconn()
     try:
-        # Get all dates in the range
-        all_dates = get_date_list(start_date, end_date)
-        
-        # Query database for existing dates
-        if set_spec:
-            query = f"""
-                SELECT DISTINCT DATE(header_datestamp) as harvest_date
-                FROM {SCHEMA_NAME}.{TABLE_NAME}
-                WHERE header_setSpecs::text LIKE %s
-                AND DATE(header_datestamp) BETWEEN %s AND %s
-                ORDER BY harvest_date
-            """
-            cursor.execute(query, (f'%{set_spec}%', start_date, end_date))
-        else:
-            query = f"""
-                SELECT DISTINCT DATE(header_datestamp) as harvest_date
-                FROM {SCHEMA_NAME}.{TABLE_NAME}
-                WHERE DATE(header_datestamp) BETWEEN %s AND %s
-                ORDER BY harvest_date
-            """
-            cursor.execute(query, (start_date, end_date))
-        
-        existing_dates = [row[0].isoformat() for row in cursor.fetchall()]
-        
-        # Find missing dates
-        missing_dates = [d for d in all_dates if d not in existing_dates]
-        
-        logger.info(f"Date range: {start_date} to {end_date}")
-        logger.info(f"Total dates in range: {len(all_dates)}")
-        logger.info(f"Existing dates: {len(existing_dates)}")
-        logger.info(f"Missing dates: {len(missing_dates)}")
-        
-        return missing_dates
-        
-    except Exception as e:
-        logger.error(f"Error getting missing dates: {e}")
-        return []
+        yield conn
     finally:
-        cursor.close()
-        conn.close()
+        connection_pool.putconn(conn)
+
+
+def get_missing_dates(start_date, end_date, set_spec=None):
+    """Get missing dates from the database for a given date range and set_spec"""
+    with pg_conn() as conn:
+        cursor = conn.cursor()
+        try:
+            # Compute the diff server-side with generate_series + EXCEPT so
+            # only the missing dates cross the wire. The set probe is GIN
+            # containment over the whole header_setSpecs array, mirroring
+            # the C++ port: the harvest set can appear at any position
+            # (cross-listed records carry several sets in repository
+            # order), so matching only the first element misses records
+            # and re-harvests their dates forever
+            if set_spec:
+                query = f"""
+                    SELECT d::date FROM generate_series(%s::date, %s::date, '1 day') d
+                    EXCEPT
+                    SELECT DISTINCT DATE(header_datestamp)
+                    FROM {SCHEMA_NAME}.{TABLE_NAME}
+                    WHERE header_setSpecs @> %s
+                    AND header_datestamp >= %s::date AND header_datestamp < %s::date + 1
+                    ORDER BY 1
+                """
+                cursor.execute(query, (start_date, end_date, Json([set_spec]), start_date, end_date))
+            else:
+                query = f"""
+                    SELECT d::date FROM generate_series(%s::date, %s::date, '1 day') d
+                    EXCEPT
+                    SELECT DISTINCT DATE(header_datestamp)
+                    FROM {SCHEMA_NAME}.{TABLE_NAME}
+                    WHERE header_datestamp >= %s::date AND header_datestamp < %s::date + 1
+                    ORDER BY 1
+                """
+                cursor.execute(query, (start_date, end_date, start_date, end_date))
+
+            missing_dates = [row[0].isoformat() for row in cursor.fetchall()]
+
+            logger.info(f"Date range: {start_date} to {end_date}")
+            logger.info(f"Missing dates: {len(missing_dates)}")
+
+            return missing_dates
+
+        except Exception as e:
+            logger.error(f"Error getting missing dates: {e}")
+            return []
+        finally:
+            cursor.close()
 
 
 def get_earliest_available_date():
@@ -374,7 +773,65 @@ def get_latest_available_date():
     return date.today().isoformat()
 
 
-def backfill_missing_dates(start_date=None, end_date=None, set_specs=None, sickle_client=None):
+def collapse_date_runs(missing_dates):
+    """Collapse sorted ISO date strings into contiguous (start, end) ranges"""
+    ranges = []
+    run_start = prev = None
+    for date_str in missing_dates:
+        current = date.fromisoformat(date_str)
+        if prev is not None and current == prev + timedelta(days=1):
+            prev = current
+            continue
+        if run_start is not None:
+            ranges.append((run_start, prev))
+        run_start = prev = current
+    if run_start is not None:
+        ranges.append((run_start, prev))
+    return ranges
+
+
+async def backfill_set_spec(client, set_spec, start_date, end_date, known_new=False):
+    """Backfill all missing dates for a single set specification"""
+    logger.info(f"Processing set_spec: {set_spec}")
+
+    # Get missing dates for this set_spec
+    missing_dates = get_missing_dates(start_date, end_date, set_spec)
+
+    if not missing_dates:
+        logger.info(f"No missing dates found for {set_spec}")
+        return 0
+
+    # Collapse contiguous missing dates into ranges; ListRecords pages any
+    # range via resumption tokens, so one request chain covers a whole run
+    # instead of one rate-limited request per day
+    date_ranges = collapse_date_runs(missing_dates)
+    logger.info(f"Found {len(missing_dates)} missing dates for {set_spec} in {len(date_ranges)} contiguous ranges")
+
+    total_processed = 0
+
+    for range_start, range_end in date_ranges:
+        try:
+            logger.info(f"Backfilling {set_spec} from {range_start} until {range_end}")
+
+            records_processed = await get_records(TABLE_NAME, client, "oai_dc", set_spec, range_start, range_end, known_new=known_new)
+
+            if records_processed > 0:
+                total_processed += records_processed
+                logger.info(f"Successfully processed {records_processed} records for {set_spec} from {range_start} until {range_end}")
+            elif records_processed == 0:
+                logger.info(f"No records found for {set_spec} from {range_start} until {range_end}")
+            else:
+                logger.error(f"Failed to process {set_spec} from {range_start} until {range_end}")
+
+        except Exception as e:
+            logger.error(f"Error processing {set_spec} for range {range_start} - {range_end}: {e}")
+            continue
+
+    logger.info(f"Completed backfill for {set_spec}")
+    return total_processed
+
+
+async def backfill_missing_dates(start_date=None, end_date=None, set_specs=None, client=None, known_new=False):
     """Backfill missing dates for all or specific set specifications"""
     if start_date is None:
         start_date = get_earliest_available_date()
@@ -382,77 +839,48 @@ def backfill_missing_dates(start_date=None, end_date=None, set_specs=None, sickl
         end_date = get_latest_available_date()
     if set_specs is None:
         set_specs = ['physics', 'math', 'cs', 'q-bio', 'q-fin', 'stat', 'eess', 'econ']
-    
+
     # Ensure database table exists before checking for missing dates
     logger.info("Ensuring database table exists for backfill...")
     try:
-        reset_arxiv(TABLE_NAME)
+        ensure_arxiv_table(TABLE_NAME)
         logger.info("Database table ready for backfill")
     except Exception as e:
         logger.error(f"Failed to create database table for backfill: {e}")
         return 0
-    
+
     logger.info(f"Starting backfill process from {start_date} to {end_date}")
     logger.info(f"Set specifications: {set_specs}")
-    
+
+    # Drop the GIN indexes for the duration of the load and rebuild them
+    # once at the end instead of maintaining them row by row — but only
+    # for the initial reseed; a routine incremental backfill moves far
+    # too few rows to repay two full CREATE INDEX CONCURRENTLY scans
+    if known_new:
+        pause_indexes(TABLE_NAME)
+
+    # Harvest all set_specs concurrently; the shared OaiClient keeps the
+    # aggregate request rate within arxiv.org's limits
+    results = await asyncio.gather(
+        *[backfill_set_spec(client, set_spec, start_date, end_date, known_new=known_new) for set_spec in set_specs],
+        return_exceptions=True
+    )
+
+    if known_new:
+        resume_indexes(TABLE_NAME)
+
     total_processed = 0
     successful_sets = 0
     failed_sets = 0
-    
-    for set_spec in set_specs:
-        logger.info(f"Processing set_spec: {set_spec}")
-        
-        # Get missing dates for this set_spec
-        missing_dates = get_missing_dates(start_date, end_date, set_spec)
-        
-        if not missing_dates:
-            logger.info(f"No missing dates found for {set_spec}")
+
+    for set_spec, result in zip(set_specs, results):
+        if isinstance(result, Exception):
+            failed_sets += 1
+            logger.error(f"Backfill failed for {set_spec}: {result}")
+        else:
             successful_sets += 1
-            continue
-        
-        logger.info(f"Found {len(missing_dates)} missing dates for {set_spec}")
-        
-        # Process missing dates in chunks to avoid overwhelming the API
-        chunk_size = 7  # Process one week at a time
-        date_chunks = [missing_dates[i:i + chunk_size] for i in range(0, len(missing_dates), chunk_size)]
-        
-        for chunk_idx, date_chunk in enumerate(date_chunks):
-            logger.info(f"Processing chunk {chunk_idx + 1}/{len(date_chunks)} for {set_spec}")
-            
-            for date_str in date_chunk:
-                try:
-                    # Convert single date to date range (same day)
-                    current_date = date.fromisoformat(date_str)
-                    next_date = current_date + timedelta(days=1)
-                    
-                    logger.info(f"Backfilling {set_spec} for date {date_str}")
-                    
-                    # Harvest records for this specific date
-                    records_processed = get_records(TABLE_NAME, sickle_client, "oai_dc", set_spec, current_date, next_date)
-                    
-                    if records_processed > 0:
-                        total_processed += records_processed
-                        logger.info(f"Successfully processed {records_processed} records for {set_spec} on {date_str}")
-                    elif records_processed == 0:
-                        logger.info(f"No records found for {set_spec} on {date_str}")
-                    else:
-                        logger.error(f"Failed to process {set_spec} on {date_str}")
-                    
-                    # Rate limiting between individual date requests
-                    sleep(3)
-                    
-                except Exception as e:
-                    logger.error(f"Error processing {set_spec} for date {date_str}: {e}")
-                    continue
-            
-            # Rate limiting between chunks
-            if chunk_idx < len(date_chunks) - 1:
-                logger.info("Rate limiting: waiting 5 seconds before next chunk")
-                sleep(5)
-        
-        successful_sets += 1
-        logger.info(f"Completed backfill for {set_spec}")
-    
+            total_processed += result
+
     logger.info("=" * 60)
     logger.info("BACKFILL COMPLETED - SUMMARY")
     logger.info("=" * 60)
@@ -461,127 +889,102 @@ def backfill_missing_dates(start_date=None, end_date=None, set_specs=None, sickl
     logger.info(f"Failed sets: {failed_sets}")
     logger.info(f"Total records processed: {total_processed}")
     logger.info("=" * 60)
-    
+
     return total_processed
 
 
-if __name__ == "__main__":
-    import argparse
-    
-    # Parse command line arguments
-    parser = argparse.ArgumentParser(description='arXiv data harvesting with backfill support')
-    parser.add_argument('--mode', choices=['recent', 'backfill', 'both'], default='recent',
-                       help='Harvest mode: recent (last 2 days), backfill (missing dates), or both')
-    parser.add_argument('--start-date', type=str, help='Start date for backfill (YYYY-MM-DD)')
-    parser.add_argument('--end-date', type=str, help='End date for backfill (YYYY-MM-DD)')
-    parser.add_argument('--set-specs', nargs='+', 
-                       default=['physics', 'math', 'cs', 'q-bio', 'q-fin', 'stat', 'eess', 'econ'],
-                       help='Set specifications to process')
-    args = parser.parse_args()
-    
+async def harvest_recent(client, table_name, metadata_prefix, set_specs, known_new=False):
+    """Harvest the last 2 days for all set specifications concurrently"""
+    date_from = date.today() - timedelta(days=2)
+    date_until = date.today() - timedelta(days=1)
+
+    logger.info(f"Starting recent harvest from: {date_from} until: {date_until}")
+    logger.info(f"Processing {len(set_specs)} set specifications: {set_specs}")
+
+    results = await asyncio.gather(
+        *[get_records(table_name, client, metadata_prefix, set_spec, date_from, date_until, known_new=known_new) for set_spec in set_specs],
+        return_exceptions=True
+    )
+
+    recent_records_processed = 0
+    successful_sets = 0
+    failed_sets = 0
+
+    for set_spec, result in zip(set_specs, results):
+        if isinstance(result, Exception):
+            failed_sets += 1
+            logger.error(f"Unexpected error processing {set_spec}: {result}")
+        elif result > 0:
+            recent_records_processed += result
+            successful_sets += 1
+            logger.info(f"Successfully processed {result} records for {set_spec}")
+        elif result == 0:
+            logger.info(f"No records found for {set_spec}")
+            successful_sets += 1
+        else:
+            failed_sets += 1
+            logger.error(f"Failed to process {set_spec}")
+
+    logger.info("=" * 60)
+    logger.info("RECENT HARVEST COMPLETED - SUMMARY")
+    logger.info("=" * 60)
+    logger.info(f"Total set specifications processed: {len(set_specs)}")
+    logger.info(f"Successful sets: {successful_sets}")
+    logger.info(f"Failed sets: {failed_sets}")
+    logger.info(f"Recent records processed: {recent_records_processed}")
+    logger.info("=" * 60)
+
+    return recent_records_processed
+
+
+async def main(args, known_new=False):
+    """Drive the harvest modes over a shared HTTP session and OAI client"""
     # Configuration
     max_retries = int(os.getenv('ARXIV_MAX_RETRIES', '3'))
-    retry_status_codes = [503, 429]  # Added 429 for rate limit exceeded
     default_retry_after = int(os.getenv('ARXIV_RETRY_AFTER', '5'))
     table_name = TABLE_NAME
     rate_limit_delay = int(os.getenv('ARXIV_RATE_LIMIT_DELAY', '3'))
 
-    # Initialize sickle with arXiv OAI-PMH base URL
+    # arXiv OAI-PMH base URL
     base_url = 'http://export.arxiv.org/oai2'
-    sickle = Sickle(
-        base_url, 
-        max_retries=max_retries, 
-        retry_status_codes=retry_status_codes, 
-        default_retry_after=default_retry_after
-    )
-
-    # Ensure database table exists
-    logger.info("Ensuring database table exists...")
-    try:
-        reset_arxiv(table_name)
-        logger.info("Database table ready")
-    except Exception as e:
-        logger.error(f"Failed to create database table: {e}")
-        sys.exit(1)
 
     # Define the parameters for harvesting
     metadata_prefix = 'oai_dc'
     set_specs = args.set_specs
-    
+
     # Initialize metrics
     start_arxiv = datetime.now()
     total_records_processed = 0
-    
-    # Process based on mode
-    if args.mode in ['recent', 'both']:
-        # Recent harvest (last 2 days)
-        date_from = date.today() - timedelta(days=2)
-        date_until = date.today() - timedelta(days=1)
-        
-        logger.info(f"Starting recent harvest from: {date_from} until: {date_until}")
-        logger.info(f"Rate limiting: {rate_limit_delay} seconds between requests")
-        logger.info(f"Processing {len(set_specs)} set specifications: {set_specs}")
-
-        recent_records_processed = 0
-        successful_sets = 0
-        failed_sets = 0
-
-        # Process each set specification with rate limiting
-        for i, set_spec in enumerate(set_specs):
-            logger.info(f"Processing set_spec {i+1}/{len(set_specs)}: {set_spec}")
-            
-            try:
-                records_processed = get_records(table_name, sickle, metadata_prefix, set_spec, date_from, date_until)
-                
-                if records_processed > 0:
-                    recent_records_processed += records_processed
-                    successful_sets += 1
-                    logger.info(f"Successfully processed {records_processed} records for {set_spec}")
-                elif records_processed == 0:
-                    logger.info(f"No records found for {set_spec}")
-                    successful_sets += 1
-                else:
-                    failed_sets += 1
-                    logger.error(f"Failed to process {set_spec}")
-                    
-            except Exception as e:
-                failed_sets += 1
-                logger.error(f"Unexpected error processing {set_spec}: {e}")
-            
-            # Rate limiting: wait between different set_specs (except for the last one)
-            if i < len(set_specs) - 1:
-                logger.info(f"Rate limiting: waiting {rate_limit_delay} seconds before next set_spec")
-                sleep(rate_limit_delay)
-
-        total_records_processed += recent_records_processed
-        
-        logger.info("=" * 60)
-        logger.info("RECENT HARVEST COMPLETED - SUMMARY")
-        logger.info("=" * 60)
-        logger.info(f"Total set specifications processed: {len(set_specs)}")
-        logger.info(f"Successful sets: {successful_sets}")
-        logger.info(f"Failed sets: {failed_sets}")
-        logger.info(f"Recent records processed: {recent_records_processed}")
-        logger.info("=" * 60)
-    
-    if args.mode in ['backfill', 'both']:
-        # Backfill missing dates
-        start_date = args.start_date
-        end_date = args.end_date
-        
-        logger.info("Starting backfill process...")
-        backfill_records_processed = backfill_missing_dates(
-            start_date=start_date, 
-            end_date=end_date, 
-            set_specs=set_specs, 
-            sickle_client=sickle
-        )
-        
-        total_records_processed += backfill_records_processed
+
+    # Cap connections to arXiv at the host level as a backstop; the
+    # client's rate limiter already serializes actual requests. Keep idle
+    # connections alive well past the inter-request gap so every page rides
+    # the same TCP connection, and bound connect and read phases separately
+    # so a stalled response is noticed without penalizing slow pages
+    connector = aiohttp.TCPConnector(limit_per_host=8, keepalive_timeout=60)
+    timeout = aiohttp.ClientTimeout(connect=5, sock_read=60)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        client = OaiClient(session, base_url, rate_limit_delay, max_retries, default_retry_after)
+
+        # Process based on mode
+        if args.mode in ['recent', 'both']:
+            logger.info(f"Rate limiting: {rate_limit_delay} seconds between requests")
+            total_records_processed += await harvest_recent(client, table_name, metadata_prefix, set_specs, known_new=known_new)
+
+        if args.mode in ['backfill', 'both']:
+            logger.info("Starting backfill process...")
+            backfill_records_processed = await backfill_missing_dates(
+                start_date=args.start_date,
+                end_date=args.end_date,
+                set_specs=set_specs,
+                client=client,
+                known_new=known_new
+            )
+            total_records_processed += backfill_records_processed
 
     # Calculate and display final metrics
     total_time = datetime.now() - start_arxiv
-    
+
     logger.info("=" * 60)
     logger.info("OVERALL HARVEST COMPLETED - FINAL SUMMARY")
     logger.info("=" * 60)
@@ -590,3 +993,41 @@ if __name__ == "__main__":
     logger.info(f"Time elapsed: {total_time}")
     logger.info(f"Records per minute: {total_records_processed / (total_time.total_seconds() / 60) if total_time.total_seconds() > 0 else 0:.2f}")
     logger.info("=" * 60)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    # Parse command line arguments
+    parser = argparse.ArgumentParser(description='arXiv data harvesting with backfill support')
+    parser.add_argument('--mode', choices=['recent', 'backfill', 'both'], default='recent',
+                       help='Harvest mode: recent (last 2 days), backfill (missing dates), or both')
+    parser.add_argument('--start-date', type=str, help='Start date for backfill (YYYY-MM-DD)')
+    parser.add_argument('--end-date', type=str, help='End date for backfill (YYYY-MM-DD)')
+    parser.add_argument('--set-specs', nargs='+',
+                       default=['physics', 'math', 'cs', 'q-bio', 'q-fin', 'stat', 'eess', 'econ'],
+                       help='Set specifications to process')
+    parser.add_argument('--init-schema', action='store_true',
+                       help='Force the schema/table/index DDL to run even if the table exists')
+    args = parser.parse_args()
+
+    # Size the pool before the first borrow: one connection per
+    # concurrently harvested set_spec plus headroom for the maintenance
+    # helpers, so extra --set-specs don't fail on pool exhaustion
+    _get_pool(len(args.set_specs) + 2)
+
+    # Ensure database table exists; a freshly created table means every
+    # harvested identifier is new, enabling the direct COPY fast path
+    logger.info("Ensuring database table exists...")
+    table_created = False
+    try:
+        if args.init_schema:
+            reset_arxiv(TABLE_NAME)
+        else:
+            table_created = ensure_arxiv_table(TABLE_NAME)
+        logger.info("Database table ready")
+    except Exception as e:
+        logger.error(f"Failed to create database table: {e}")
+        sys.exit(1)
+
+    asyncio.run(main(args, known_new=table_created))